@@ -95,8 +95,13 @@ class ArxivCollector(BaseCollector):
 
     API_URL = "http://export.arxiv.org/api/query"
 
-    def __init__(self, config: dict):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(config, session, semaphore)
         self.categories = config.get("categories", ["cs.AI", "cs.LG"])
         self.max_results = config.get("max_results", 50)  # Fetch more to filter
         self.filter_companies = config.get("filter_companies", True)
@@ -119,7 +124,7 @@ class ArxivCollector(BaseCollector):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(
                     self.API_URL,
                     params=params,
@@ -257,7 +262,11 @@ class ArxivCollector(BaseCollector):
         return items
 
 
-async def collect_arxiv(arxiv_config: dict) -> list[NewsItem]:
+async def collect_arxiv(
+    arxiv_config: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[NewsItem]:
     """Collect from arXiv."""
-    collector = ArxivCollector(arxiv_config)
+    collector = ArxivCollector(arxiv_config, session, semaphore)
     return await collector.collect()
@@ -2,14 +2,17 @@
 Base collector interface and common utilities.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 import hashlib
+import aiohttp
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """Represents a single news/article item."""
     title: str
@@ -52,15 +55,43 @@ class NewsItem:
 class BaseCollector(ABC):
     """Abstract base class for all collectors."""
 
-    def __init__(self, config: dict):
+    def __init__(
+        self,
+        config: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
         self.config = config
         self.name = self.__class__.__name__
+        # Shared session owned by the caller; None means one per request
+        self.session = session
+        # Caller-wide bound on in-flight requests across all collectors
+        self.semaphore = semaphore
 
     @abstractmethod
     async def collect(self) -> list[NewsItem]:
         """Collect news items from the source."""
         pass
 
+    @asynccontextmanager
+    async def http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session if one was given, else a private one closed on exit.
+
+        Each use wraps a single request, so it also holds one slot of the
+        shared semaphore (if any) for that request's duration.
+        """
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        try:
+            if self.session is not None:
+                yield self.session
+            else:
+                async with aiohttp.ClientSession() as session:
+                    yield session
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+
     def is_enabled(self) -> bool:
         """Check if this collector is enabled."""
         return self.config.get("enabled", True)
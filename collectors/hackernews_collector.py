@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 import asyncio
 import re
 from datetime import datetime, timezone
+from typing import Optional
 import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
@@ -15,8 +16,13 @@ from .base import BaseCollector, NewsItem
 class HackerNewsCollector(BaseCollector):
     """Collect AI-related discussions from Hacker News."""
 
-    def __init__(self, config: dict):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(config, session, semaphore)
         self.feed_url = config.get(
             "url",
             "https://hnrss.org/newest?q=AI+OR+LLM+OR+GPT+OR+machine+learning"
@@ -33,7 +39,7 @@ class HackerNewsCollector(BaseCollector):
             headers = {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             }
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url, headers=headers, timeout=10) as response:
                     if response.status != 200:
                         return ""
@@ -60,7 +66,7 @@ class HackerNewsCollector(BaseCollector):
             return []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(
                     self.feed_url,
                     timeout=aiohttp.ClientTimeout(total=30),
@@ -162,7 +168,11 @@ class HackerNewsCollector(BaseCollector):
         return items
 
 
-async def collect_hackernews(hn_config: dict) -> list[NewsItem]:
+async def collect_hackernews(
+    hn_config: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[NewsItem]:
     """Collect from Hacker News."""
-    collector = HackerNewsCollector(hn_config)
+    collector = HackerNewsCollector(hn_config, session, semaphore)
     return await collector.collect()
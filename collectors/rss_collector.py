@@ -14,8 +14,14 @@ from .base import BaseCollector, NewsItem
 class RSSCollector(BaseCollector):
     """Collect news from RSS feeds."""
 
-    def __init__(self, source_id: str, source_config: dict):
-        super().__init__(source_config)
+    def __init__(
+        self,
+        source_id: str,
+        source_config: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(source_config, session, semaphore)
         self.source_id = source_id
         self.feed_url = source_config["url"]
         self.source_name = source_config["name"]
@@ -35,7 +41,7 @@ class RSSCollector(BaseCollector):
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
             }
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(
                     self.feed_url,
                     timeout=aiohttp.ClientTimeout(total=30, connect=10),
@@ -208,13 +214,21 @@ class RSSCollector(BaseCollector):
         return any(marker in text_lower for marker in invalid_markers)
 
 
-async def collect_all_rss(rss_config: dict) -> list[NewsItem]:
-    """Collect from all configured RSS sources."""
+async def collect_all_rss(
+    rss_config: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[NewsItem]:
+    """Collect from all configured RSS sources.
+
+    Pass a shared session to reuse pooled connections across feeds, and a
+    shared semaphore to bound concurrent fetches across collectors.
+    """
     collectors = []
 
     for source_id, source_config in rss_config.items():
         if source_config.get("enabled", True):
-            collectors.append(RSSCollector(source_id, source_config))
+            collectors.append(RSSCollector(source_id, source_config, session, semaphore))
 
     # Run all collectors concurrently
     tasks = [c.collect() for c in collectors]
@@ -5,6 +5,7 @@ Twitter/X collector via Nitter and other alternatives.
 import asyncio
 import random
 from datetime import datetime, timezone
+from typing import Optional
 import aiohttp
 import feedparser
 from .base import BaseCollector, NewsItem
@@ -13,8 +14,13 @@ from .base import BaseCollector, NewsItem
 class TwitterCollector(BaseCollector):
     """Collect tweets via Nitter RSS or other alternatives."""
 
-    def __init__(self, config: dict):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        super().__init__(config, session, semaphore)
         self.method = config.get("method", "nitter")
         self.accounts = config.get("accounts", [])
         self.nitter_instances = config.get("nitter_instances", [
@@ -71,7 +77,7 @@ class TwitterCollector(BaseCollector):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "application/rss+xml,application/xml;q=0.9,*/*;q=0.8"
             }
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(
                     url,
                     timeout=aiohttp.ClientTimeout(total=10, connect=5),
@@ -142,7 +148,11 @@ class TwitterCollector(BaseCollector):
         return text
 
 
-async def collect_twitter(twitter_config: dict) -> list[NewsItem]:
+async def collect_twitter(
+    twitter_config: dict,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list[NewsItem]:
     """Collect from Twitter/X."""
-    collector = TwitterCollector(twitter_config)
+    collector = TwitterCollector(twitter_config, session, semaphore)
     return await collector.collect()
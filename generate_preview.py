@@ -23,11 +23,17 @@ from collectors import (
 )
 from processors import process_items, GeminiSummarizer
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    _YamlLoader = yaml.SafeLoader
+
 
 def load_config():
     config_path = Path(__file__).parent / "config" / "sources.yaml"
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Hand libyaml the raw bytes; it decodes UTF-8 itself
+    with open(config_path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
 
 
 async def generate_preview():
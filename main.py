@@ -7,6 +7,7 @@ and sends a beautifully formatted email digest.
 """
 
 import asyncio
+import logging
 import os
 import sys
 from datetime import datetime
@@ -33,11 +34,17 @@ from processors import GeminiSummarizer, process_items
 from email_sender import send_digest_email, EmailSender, WEASYPRINT_AVAILABLE
 from publishers.feishu_publisher import FeishuPublisher
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    _YamlLoader = yaml.SafeLoader
+
 
 def load_config(config_path: str = "config/sources.yaml") -> dict:
     """Load configuration from YAML file."""
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Hand libyaml the raw bytes; it decodes UTF-8 itself
+    with open(config_path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
 
 
 async def collect_all_sources(config: dict) -> list[NewsItem]:
@@ -172,42 +179,42 @@ async def main_async():
 
     if feishu_config.get("enabled", False):
         print("\n🚀 Publishing to Feishu...")
-        publisher = FeishuPublisher()
-        if publisher.is_configured():
-            title = feishu_config.get("title_format", "AI Daily Digest - {date}").format(date=date_str)
-
-            # Publish to Feishu Bot (Push)
-            bot_config = publishers_config.get("feishu_bot", {})
-            if bot_config.get("enabled", False):
-                chat_id_str = bot_config.get("chat_id") or os.environ.get("FEISHU_BOT_CHAT_ID")
-                if chat_id_str:
-                    chat_ids = [cid.strip() for cid in chat_id_str.split(',') if cid.strip()]
-
-                    if chat_ids:
-                        first_chat_id = chat_ids[0]
-                        doc_url = None
-
-                        # Upload PDF to Feishu (same content as email)
-                        if pdf_path and Path(pdf_path).exists():
-                            doc_url = await publisher.upload_pdf(pdf_path, title, first_chat_id)
-                            if doc_url:
-                                print(f"   PDF available at: {doc_url}")
+        async with FeishuPublisher() as publisher:
+            if publisher.is_configured():
+                title = feishu_config.get("title_format", "AI Daily Digest - {date}").format(date=date_str)
+
+                # Publish to Feishu Bot (Push)
+                bot_config = publishers_config.get("feishu_bot", {})
+                if bot_config.get("enabled", False):
+                    chat_id_str = bot_config.get("chat_id") or os.environ.get("FEISHU_BOT_CHAT_ID")
+                    if chat_id_str:
+                        chat_ids = [cid.strip() for cid in chat_id_str.split(',') if cid.strip()]
+
+                        if chat_ids:
+                            first_chat_id = chat_ids[0]
+                            doc_url = None
+
+                            # Upload PDF to Feishu (same content as email)
+                            if pdf_path and Path(pdf_path).exists():
+                                doc_url = await publisher.upload_pdf(pdf_path, title, first_chat_id)
+                                if doc_url:
+                                    print(f"   PDF available at: {doc_url}")
+                            else:
+                                print("   ⚠️ PDF not available, skipping Feishu upload")
+
+                            print(f"\n🤖 Pushing to {len(chat_ids)} Feishu Bot Group(s)...")
+                            for cid in chat_ids:
+                                await publisher.send_digest_card(cid, title, highlights, categories, category_names, doc_url)
+
+                            # Cleanup old documents (older than 180 days)
+                            print("\n🧹 Checking for old documents to clean up...")
+                            await publisher.cleanup_old_documents()
                         else:
-                            print("   ⚠️ PDF not available, skipping Feishu upload")
-
-                        print(f"\n🤖 Pushing to {len(chat_ids)} Feishu Bot Group(s)...")
-                        for cid in chat_ids:
-                            await publisher.send_digest_card(cid, title, highlights, categories, category_names, doc_url)
-
-                        # Cleanup old documents (older than 180 days)
-                        print("\n🧹 Checking for old documents to clean up...")
-                        await publisher.cleanup_old_documents()
+                            print("   ⚠️ Feishu bot enabled but no valid chat IDs found")
                     else:
-                        print("   ⚠️ Feishu bot enabled but no valid chat IDs found")
-                else:
-                    print("   ⚠️ Feishu bot enabled but FEISHU_BOT_CHAT_ID not set")
-        else:
-            print("   ⚠️ Feishu publisher enabled but credentials not found (FEISHU_APP_ID/SECRET)")
+                        print("   ⚠️ Feishu bot enabled but FEISHU_BOT_CHAT_ID not set")
+            else:
+                print("   ⚠️ Feishu publisher enabled but credentials not found (FEISHU_APP_ID/SECRET)")
 
     print("\n✅ Daily digest completed!")
     return 0
@@ -215,7 +222,9 @@ async def main_async():
 
 def main():
     """Wrapper for async main."""
-    sys.exit(asyncio.run(main_async()))
+    # Synchronous handler on stdout, so log lines stay in order with print() output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    return asyncio.run(main_async())
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ Usage:
 """
 
 import asyncio
+import logging
 import sys
 import os
 from datetime import datetime
@@ -22,94 +23,93 @@ from publishers.feishu_publisher import FeishuPublisher
 
 async def list_documents():
     """List all documents created by the app."""
-    publisher = FeishuPublisher()
+    async with FeishuPublisher() as publisher:
+        if not publisher.is_configured():
+            print("❌ Feishu not configured")
+            return
 
-    if not publisher.is_configured():
-        print("❌ Feishu not configured")
-        return
+        print("\n📄 Fetching documents...\n")
+        docs = await publisher.list_app_documents()
 
-    print("\n📄 Fetching documents...\n")
-    docs = await publisher.list_app_documents()
+        if not docs:
+            print("No documents found.")
+            return
 
-    if not docs:
-        print("No documents found.")
-        return
+        print(f"Found {len(docs)} documents:\n")
+        print(f"{'No.':<4} {'Title':<50} {'Token':<30} {'Created'}")
+        print("-" * 100)
 
-    print(f"Found {len(docs)} documents:\n")
-    print(f"{'No.':<4} {'Title':<50} {'Token':<30} {'Created'}")
-    print("-" * 100)
+        for i, doc in enumerate(docs, 1):
+            title = doc.get("name", "Untitled")[:48]
+            token = doc.get("token", "")
+            created = doc.get("created_time", 0)
+            if created:
+                created_str = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M")
+            else:
+                created_str = "Unknown"
 
-    for i, doc in enumerate(docs, 1):
-        title = doc.get("name", "Untitled")[:48]
-        token = doc.get("token", "")
-        created = doc.get("created_time", 0)
-        if created:
-            created_str = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M")
-        else:
-            created_str = "Unknown"
-
-        print(f"{i:<4} {title:<50} {token:<30} {created_str}")
+            print(f"{i:<4} {title:<50} {token:<30} {created_str}")
 
 
 async def delete_document(token: str):
     """Delete a specific document."""
-    publisher = FeishuPublisher()
-
-    if not publisher.is_configured():
-        print("❌ Feishu not configured")
-        return
+    async with FeishuPublisher() as publisher:
+        if not publisher.is_configured():
+            print("❌ Feishu not configured")
+            return
 
-    print(f"\n🗑️ Deleting document: {token}")
-    success = await publisher.delete_document(token)
+        print(f"\n🗑️ Deleting document: {token}")
+        success = await publisher.delete_document(token)
 
-    if success:
-        print("✅ Document deleted successfully")
-    else:
-        print("❌ Failed to delete document")
+        if success:
+            print("✅ Document deleted successfully")
+        else:
+            print("❌ Failed to delete document")
 
 
 async def cleanup_interactive():
     """Interactive cleanup of documents."""
-    publisher = FeishuPublisher()
-
-    if not publisher.is_configured():
-        print("❌ Feishu not configured")
-        return
+    async with FeishuPublisher() as publisher:
+        if not publisher.is_configured():
+            print("❌ Feishu not configured")
+            return
 
-    print("\n📄 Fetching documents...\n")
-    docs = await publisher.list_app_documents()
+        print("\n📄 Fetching documents...\n")
+        docs = await publisher.list_app_documents()
 
-    if not docs:
-        print("No documents found.")
-        return
+        if not docs:
+            print("No documents found.")
+            return
 
-    print(f"Found {len(docs)} documents:\n")
+        print(f"Found {len(docs)} documents:\n")
 
-    for i, doc in enumerate(docs, 1):
-        title = doc.get("name", "Untitled")
-        token = doc.get("token", "")
-        created = doc.get("created_time", 0)
-        if created:
-            created_str = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M")
-        else:
-            created_str = "Unknown"
+        for i, doc in enumerate(docs, 1):
+            title = doc.get("name", "Untitled")
+            token = doc.get("token", "")
+            created = doc.get("created_time", 0)
+            if created:
+                created_str = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M")
+            else:
+                created_str = "Unknown"
 
-        print(f"\n{i}. {title}")
-        print(f"   Token: {token}")
-        print(f"   Created: {created_str}")
+            print(f"\n{i}. {title}")
+            print(f"   Token: {token}")
+            print(f"   Created: {created_str}")
 
-        choice = input("   Delete this document? [y/N/q(quit)]: ").strip().lower()
+            choice = input("   Delete this document? [y/N/q(quit)]: ").strip().lower()
 
-        if choice == 'q':
-            print("\nCleanup cancelled.")
-            break
-        elif choice == 'y':
-            await publisher.delete_document(token)
+            if choice == 'q':
+                print("\nCleanup cancelled.")
+                break
+            elif choice == 'y':
+                await publisher.delete_document(token)
 
-    print("\n✅ Cleanup complete")
+        print("\n✅ Cleanup complete")
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     if len(sys.argv) < 2:
         print(__doc__)
         return
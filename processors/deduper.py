@@ -4,11 +4,14 @@ Deduplication and ranking utilities.
 
 from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Iterable, Optional
 from collectors.base import NewsItem
 
+# Sort key for undated items, so they sink to the end of newest-first order
+_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
 
-def deduplicate_items(items: list[NewsItem]) -> list[NewsItem]:
+
+def deduplicate_items(items: Iterable[NewsItem]) -> list[NewsItem]:
     """Remove duplicate items based on URL and similar titles."""
     seen_urls = set()
     seen_titles = set()
@@ -74,7 +77,7 @@ def sort_items(
     if by == "published":
         return sorted(
             items,
-            key=lambda x: x.published or datetime.min.replace(tzinfo=timezone.utc),
+            key=lambda x: x.published or _MIN_DATETIME,
             reverse=True
         )
     elif by == "score":
@@ -93,11 +96,14 @@ def group_by_category(
 
 
 def process_items(
-    items: list[NewsItem],
+    items: Iterable[NewsItem],
     max_per_category: int = 5,
     days: float = 1.0  # Reduced to 1.0 (24 hours) for strict daily filtering
 ) -> dict[str, list[NewsItem]]:
-    """Full processing pipeline: dedupe, filter, sort, group."""
+    """Full processing pipeline: dedupe, filter, sort, group.
+
+    items may be any iterable; it is consumed once by deduplication.
+    """
     # Deduplicate
     items = deduplicate_items(items)
 
@@ -7,44 +7,190 @@ import json
 import os
 import re
 import asyncio
+import hashlib
+import random
+import tempfile
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
+from aiolimiter import AsyncLimiter
 from google.oauth2 import service_account
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 from collectors.base import NewsItem
 
 # 默认 Service Account 文件路径（项目根目录下）
 _DEFAULT_SA_FILE = str(Path(__file__).resolve().parent.parent / "transsion-sw-cd-6610d5d50199.json")
 
+# 模型偶尔会在标题/摘要前输出标签前缀（"中文标题："、"摘要：" 等）
+_LABEL_PREFIX_RE = re.compile(r'^(?:(?:中文)?标题|摘要)[:：]\s*')
+# 标题前偶尔残留相关性判定行（"AI: YES ...:"）；只用于标题，避免误删以 "AI:" 开头的正常摘要
+_VERDICT_PREFIX_RE = re.compile(r'^AI[:：]\s*(?:YES|NO|Related).*?[:：]\s*', re.IGNORECASE)
+_HIGHLIGHT_PREFIX_RE = re.compile(r'^(AI[:：]\s*(YES|NO|Related)|Title:|Summary:).*?[:：]\s*', re.IGNORECASE)
+_NUM_SPLIT_RE = re.compile(r'(\d+)[.、．]\s*')
+_BULLET_RE = re.compile(r'^[-*•]\s*')
+
+# Gemini 结构化输出 schema：配合 response_mime_type=application/json，返回经过校验的 JSON
+_TRANSLATE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "is_relevant": {"type": "BOOLEAN"},
+        "title": {"type": "STRING"},
+        "summary": {"type": "STRING"},
+    },
+    "required": ["is_relevant", "title", "summary"],
+}
+_SUMMARY_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "is_relevant": {"type": "BOOLEAN"},
+        "summary": {"type": "STRING"},
+    },
+    "required": ["is_relevant", "summary"],
+}
+_PAIR_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "title": {"type": "STRING"},
+        "summary": {"type": "STRING"},
+    },
+    "required": ["title", "summary"],
+}
+_HIGHLIGHTS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "highlights": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["highlights"],
+}
+_GROUPS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "groups": {"type": "ARRAY", "items": {"type": "ARRAY", "items": {"type": "INTEGER"}}},
+    },
+    "required": ["groups"],
+}
+
+# 本地 NMT 模型（可选依赖 transformers），短文本翻译不走 Gemini，省去一次网络往返
+_NMT_MODEL = "Helsinki-NLP/opus-mt-en-zh"
+_NMT_MAX_WORDS = 15
+
+# 限流/过载时的重试：指数退避，最多重试 _MAX_RETRIES 次
+_RETRYABLE_CODES = (429, 503)
+_MAX_RETRIES = 4
+
+# 翻译/摘要结果缓存条数上限（按内容哈希去重，重复的模板文本不再调用 Gemini）
+_CACHE_MAX_ENTRIES = 1024
+
+# 已是中文且长度合适的摘要直接沿用，不再调用 Gemini；需要强制改写时置为 False
+CHINESE_SUMMARY_FAST_PATH = True
+
+# is_english 用的 CJK 统一表意文字匹配
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# 中文条目直通时的廉价 AI 相关性判断（替代 Gemini 的 is_relevant 判断）
+# 英文缩写两侧用字母环视而非 \b：中文字符与字母之间 \b 不成立（如“华为发布AI手机”）
+_AI_KEYWORD_RE = re.compile(
+    r'(?<![A-Za-z])(?:AI|AGI|AIGC|LLMs?|GPT)(?![A-Za-z])|人工智能|大模型|智能体|机器学习|深度学习|神经网络|生成式',
+    re.IGNORECASE,
+)
+
 
 def is_english(text: str) -> bool:
     """检查文本是否主要是英文（或非中文）。"""
     if not text:
         return False
 
-    chinese_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
+    # 没有任何中文字符：一次正则扫描即可判定
+    if _CJK_RE.search(text) is None:
+        return True
+
+    # 短文本只要含中文就不算英文，无需计数
+    if len(text) <= 30:
+        return False
+
+    # 中文占比 >= 5% 即非英文：数到 ceil(len/20) 个中文字符就可提前结束
+    threshold = -(-len(text) // 20)
+    chinese_chars = sum(1 for _ in islice(_CJK_RE.finditer(text), threshold))
+    return chinese_chars < threshold
+
 
-    if chinese_chars >= 1:
-        if len(text) > 30 and (chinese_chars / len(text)) < 0.05:
-            return True
+def _clip_content(item: NewsItem, limit: int = 10000) -> str:
+    """取 content 与 summary 中较长者，超过 limit 时截断（未超长则不复制）。"""
+    summary = item.summary or ""
+    content = item.content or ""
+    if len(summary) >= len(content):
+        content = summary
+    return content if len(content) <= limit else content[:limit] + "..."
+
+
+def _is_chinese_passthrough(item: NewsItem) -> bool:
+    """标题与摘要均已是中文、摘要不超过300字且明显与 AI 相关时，无需再经 Gemini 处理。
+
+    phone_ai 需要 Gemini 的严格相关性判断，不走直通；内容不足80字的条目
+    与 summarize_and_translate 的质量门槛一致，同样不直通（交由其丢弃）。
+    """
+    if item.category == "phone_ai":
+        return False
+    if len(_clip_content(item).strip()) < 80:
+        return False
+    summary = item.summary or ""
+    if not 5 <= len(summary.strip()) <= 300:
+        return False
+    if is_english(item.title) or is_english(summary):
         return False
+    return _AI_KEYWORD_RE.search(item.title) is not None or _AI_KEYWORD_RE.search(summary) is not None
 
-    return True
+
+def _cache_key(*parts: str) -> str:
+    """按内容生成缓存键（blake2b，比 sha256 更快）。"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _cache_get(cache: OrderedDict, key: str):
+    """LRU 读取：命中时移到末尾。"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: str, value) -> None:
+    """LRU 写入：超过上限时淘汰最久未使用的条目。"""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
 
 
 def _clean_json_response(text: str) -> str:
-    """清理 Gemini 返回的 JSON 文本（去除 markdown code blocks 等）。"""
-    text = text.strip()
-    if text.startswith("```json"):
-        text = text[7:]
-    if text.startswith("```"):
-        text = text[3:]
-    if text.endswith("```"):
-        text = text[:-3]
-    return text.strip()
+    """清理 Gemini 返回的 JSON 文本（去除 markdown code blocks 等）。
+
+    JSON mode 下通常不会出现代码块，这里只作为兜底。
+    """
+    return text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+
+def _parse_json_response(text: str) -> Optional[dict]:
+    """解析 Gemini 返回的 JSON 对象，失败或不是对象时返回 None（优先使用 orjson）。"""
+    try:
+        data = _json_loads(_clean_json_response(text))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
 
 
 class GeminiSummarizer:
@@ -56,13 +202,13 @@ class GeminiSummarizer:
         model: str = "gemini-2.0-flash",
         project: str = "transsion-sw-cd",
         location: str = "global",
+        requests_per_minute: int = 55,
     ):
         sa_file = service_account_file or os.environ.get("GOOGLE_SA_FILE", _DEFAULT_SA_FILE)
 
         # 支持通过环境变量传入 JSON 内容（用于 CI/CD）
         sa_json_content = os.environ.get("GOOGLE_SA_JSON")
         if sa_json_content and not Path(sa_file).exists():
-            import tempfile
             tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
             tmp.write(sa_json_content)
             tmp.close()
@@ -86,27 +232,54 @@ class GeminiSummarizer:
             credentials=credentials,
         )
         self.model_name = model
+        # semaphore 限制并发数，limiter 按令牌桶限制每分钟请求数（按 Gemini 配额调整）
         self.semaphore = asyncio.Semaphore(5)
+        self._limiter = AsyncLimiter(max_rate=requests_per_minute, time_period=60)
+        self._configs: dict[tuple, types.GenerateContentConfig] = {}
+        # 单字段翻译存 str，标题+摘要合并翻译存 (title, summary)
+        self._translate_cache: OrderedDict[str, str | tuple[str, str]] = OrderedDict()
+        self._summary_cache: OrderedDict[str, tuple[str, str, bool]] = OrderedDict()
+        self._nmt = None
+        self._nmt_loaded = False
+        self._nmt_lock = asyncio.Lock()
 
     # ──────────────────────────────────────────────
     #  底层调用
     # ──────────────────────────────────────────────
 
-    async def _call(self, prompt: str, *, json_mode: bool = False) -> str:
-        """统一的 Gemini 调用入口，返回纯文本。"""
-        config = types.GenerateContentConfig(
-            temperature=0.2,
-            max_output_tokens=4096,
-        )
-        if json_mode:
-            config.response_mime_type = "application/json"
-
-        async with self.semaphore:
-            response = await self.client.aio.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=config,
+    def _get_config(self, *, json_mode: bool = False, schema: Optional[dict] = None) -> types.GenerateContentConfig:
+        """按 (json_mode, schema) 缓存生成配置，避免每次调用重新构造并校验。"""
+        json_mode = json_mode or schema is not None
+        key = (json_mode, id(schema) if schema is not None else None)
+        config = self._configs.get(key)
+        if config is None:
+            config = types.GenerateContentConfig(
+                temperature=0.2,
+                max_output_tokens=4096,
+                response_mime_type="application/json" if json_mode else None,
+                response_schema=schema,
             )
+            self._configs[key] = config
+        return config
+
+    async def _call(self, prompt: str, *, json_mode: bool = False, schema: Optional[dict] = None) -> str:
+        """统一的 Gemini 调用入口，返回纯文本。传入 schema 时隐含 json_mode。"""
+        config = self._get_config(json_mode=json_mode, schema=schema)
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                async with self._limiter, self.semaphore:
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=prompt,
+                        config=config,
+                    )
+                break
+            except errors.APIError as e:
+                if e.code not in _RETRYABLE_CODES or attempt == _MAX_RETRIES:
+                    raise
+                delay = min(2 ** attempt, 30) + random.random()
+                print(f"   ⏳ Gemini {e.code}, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
 
         if not response or not response.candidates:
             raise RuntimeError("Gemini 未返回有效响应")
@@ -122,11 +295,53 @@ class GeminiSummarizer:
     #  翻译
     # ──────────────────────────────────────────────
 
+    def _load_nmt(self):
+        """懒加载本地翻译模型；未安装 transformers 或加载失败时返回 None。"""
+        if not self._nmt_loaded:
+            self._nmt_loaded = True
+            try:
+                from transformers import pipeline
+                self._nmt = pipeline("translation", model=_NMT_MODEL, device=-1)
+            except ImportError:
+                pass
+            except Exception as e:
+                print(f"[NMT] Failed to load {_NMT_MODEL}, falling back to Gemini: {e}")
+        return self._nmt
+
+    async def _translate_local(self, text: str) -> Optional[str]:
+        """用本地 NMT 模型翻译短文本，模型不可用时返回 None。"""
+        if self._nmt_loaded and self._nmt is None:
+            return None
+
+        # 模型加载和推理都是阻塞的 CPU 操作，放到线程里并串行执行
+        async with self._nmt_lock:
+            nmt = await asyncio.to_thread(self._load_nmt)
+            if nmt is None:
+                return None
+            try:
+                result = await asyncio.to_thread(nmt, text)
+            except Exception as e:
+                print(f"[NMT] Translation error: {e}")
+                return None
+
+        return result[0]["translation_text"].strip() if result else None
+
     async def translate_to_chinese(self, text: str) -> str:
-        """将英文文本翻译成中文。"""
+        """将英文文本翻译成中文。短文本优先使用本地模型。"""
         if not text or len(text) < 2:
             return text or ""
 
+        key = _cache_key(text)
+        cached = _cache_get(self._translate_cache, key)
+        if cached is not None:
+            return cached
+
+        if len(text.split()) < _NMT_MAX_WORDS:
+            local = await self._translate_local(text)
+            if local and not is_english(local):
+                _cache_put(self._translate_cache, key, local)
+                return local
+
         prompt = f"""Translate the following text into Simplified Chinese (简体中文).
 
 Original Text:
@@ -143,11 +358,67 @@ Task Instructions:
             if (result.startswith('"') and result.endswith('"')) or \
                (result.startswith("'") and result.endswith("'")):
                 result = result[1:-1].strip()
+            if result:
+                _cache_put(self._translate_cache, key, result)
             return result
         except Exception as e:
             print(f"Translation error: {e}")
             return text
 
+    async def translate_pair_to_chinese(self, title: str, summary: str) -> tuple[str, str]:
+        """一次调用同时翻译标题和摘要。失败时返回原文。"""
+        key = _cache_key("pair", title, summary)
+        cached = _cache_get(self._translate_cache, key)
+        if cached is not None:
+            return cached
+
+        prompt = f"""Translate the following two fields into Simplified Chinese (简体中文).
+
+TITLE: {title}
+SUMMARY: {summary}
+
+Task Instructions:
+1. Translate both fields into natural-sounding Simplified Chinese.
+2. Keep brand names and technical terms in English (e.g., OpenAI, GPT-5, LLM, Claude, Google).
+3. Do not include quotes, explanations, or original text.
+
+You MUST return ONLY a valid JSON object:
+{{
+    "title": "Translated title",
+    "summary": "Translated summary"
+}}
+"""
+        try:
+            data = _parse_json_response(await self._call(prompt, schema=_PAIR_SCHEMA))
+            if data is None:
+                raise ValueError("invalid JSON response")
+            result = (
+                data.get("title", "").strip() or title,
+                data.get("summary", "").strip() or summary,
+            )
+            _cache_put(self._translate_cache, key, result)
+            return result
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return title, summary
+
+    async def _translate_english_fields(
+        self,
+        title: str,
+        summary: str,
+        *,
+        translate_title: bool,
+        translate_summary: bool,
+    ) -> tuple[str, str]:
+        """按需翻译标题/摘要，两者都需要时合并为一次调用。未翻译的字段原样返回。"""
+        if translate_title and translate_summary:
+            return await self.translate_pair_to_chinese(title, summary)
+        if translate_title:
+            return await self.translate_to_chinese(title), summary
+        if translate_summary:
+            return title, await self.translate_to_chinese(summary)
+        return title, summary
+
     # ──────────────────────────────────────────────
     #  核心：标题改写 + 摘要 + 相关性过滤
     # ──────────────────────────────────────────────
@@ -158,17 +429,18 @@ Task Instructions:
         summary = item.summary or ""
         is_translated = False
 
-        # 优先使用完整内容进行总结，取较长的那个
-        raw_content = item.content if item.content and len(item.content) > len(item.summary or "") else (item.summary or "")
+        # 优先使用完整内容进行总结，取较长的那个，并限制输入长度避免token溢出
+        raw_content = _clip_content(item)
 
         # 内容质量门槛：不足80字则直接丢弃，不送给 AI
         if len(raw_content.strip()) < 80:
             print(f"   🗑️ 内容过短，丢弃: {item.title[:40]}")
             return item.title, "IRRELEVANT", False
 
-        # 限制输入长度，避免token溢出
-        if len(raw_content) > 10000:
-            raw_content = raw_content[:10000] + "..."
+        cache_key = _cache_key(item.category, item.title, raw_content)
+        cached = _cache_get(self._summary_cache, cache_key)
+        if cached is not None:
+            return cached
 
         # phone_ai 分类需要更严格的相关性判断
         phone_ai_extra = ""
@@ -213,71 +485,64 @@ You MUST return ONLY a valid JSON object:
 """
 
         try:
-            text_response = _clean_json_response(await self._call(prompt, json_mode=True))
-
-            try:
-                data = json.loads(text_response)
-
-                # Check relevance
-                if not data.get("is_relevant", True):
-                    return item.title, "IRRELEVANT", False
-
-                json_title = data.get("title", "").strip()
-                title = json_title if json_title else item.title
-
-                summary = data.get("summary", "").strip()
-                is_translated = is_english(item.title)
-
-                title = re.sub(r'^AI[:：]\s*(YES|NO|Related).*?[:：]\s*', '', title, flags=re.IGNORECASE).strip()
-
-                # 1. Fallback for empty or too-short summary
-                if not summary or len(summary.strip()) < 5:
-                    if title:
-                        summary = f"{title}（点击查看详情）"
-                    else:
-                        summary = "暂无详细摘要，请点击标题查看原文。"
-
-                # 2. Force translation if still English (Double Insurance)
-                if is_english(summary) and len(summary) > 10:
-                    try:
-                        summary = await self.translate_to_chinese(summary)
-                    except Exception:
-                        pass
-
-                # 3. Check TITLE for English and force translate
-                if is_english(title) and len(title) >= 3:
-                    try:
-                        translated_title = await self.translate_to_chinese(title)
-                        if translated_title and not is_english(translated_title):
-                            title = translated_title
-                        else:
-                            print(f"   ⚠️ Title translation still English, keeping: {title[:30]}...")
-                    except Exception as e:
-                        print(f"   Title translation failed: {e}")
-
-                return title, summary, is_translated
-
-            except json.JSONDecodeError:
-                print(f"JSON Parse Error for '{item.title}': {text_response[:50]}...")
+            text_response = await self._call(prompt, schema=_TRANSLATE_SCHEMA)
+            data = _parse_json_response(text_response)
+            if data is None:
+                print(f"JSON Parse Error for '{item.title}': {_clean_json_response(text_response)[:50]}...")
                 return item.title, "Summary generation failed (JSON Error)", False
 
+            # Check relevance
+            if not data.get("is_relevant", True):
+                result = (item.title, "IRRELEVANT", False)
+                _cache_put(self._summary_cache, cache_key, result)
+                return result
+
+            json_title = data.get("title", "").strip()
+            title = json_title if json_title else item.title
+
+            summary = _LABEL_PREFIX_RE.sub('', data.get("summary", "").strip(), count=1)
+            is_translated = is_english(item.title)
+
+            title = _VERDICT_PREFIX_RE.sub('', title, count=1)
+            title = _LABEL_PREFIX_RE.sub('', title, count=1).strip()
+
+            # 1. Fallback for empty or too-short summary
+            if not summary or len(summary.strip()) < 5:
+                if title:
+                    summary = f"{title}（点击查看详情）"
+                else:
+                    summary = "暂无详细摘要，请点击标题查看原文。"
+
+            # 2/3. 摘要或标题仍是英文则强制翻译（Double Insurance，两者都需要时合并为一次调用）
+            translate_title = is_english(title) and len(title) >= 3
+            translated_title, summary = await self._translate_english_fields(
+                title,
+                summary,
+                translate_title=translate_title,
+                translate_summary=is_english(summary) and len(summary) > 10,
+            )
+            if translate_title:
+                if translated_title and not is_english(translated_title):
+                    title = translated_title
+                else:
+                    print(f"   ⚠️ Title translation still English, keeping: {title[:30]}...")
+
+            result = (title, summary, is_translated)
+            _cache_put(self._summary_cache, cache_key, result)
+            return result
+
         except Exception as e:
             print(f"Translate & summarize error for '{item.title[:20]}...': {e}")
-            if is_english(item.title):
-                try:
-                    translated = await self.translate_to_chinese(item.title)
-                    if translated and not is_english(translated):
-                        title = translated
-                        is_translated = True
-                except Exception:
-                    pass
-            if item.summary and is_english(item.summary):
-                try:
-                    summary = await self.translate_to_chinese(item.summary)
-                except Exception:
-                    summary = item.summary
-            else:
-                summary = item.summary or ""
+            translate_title = is_english(item.title)
+            translated_title, summary = await self._translate_english_fields(
+                item.title,
+                item.summary or "",
+                translate_title=translate_title,
+                translate_summary=bool(item.summary) and is_english(item.summary),
+            )
+            if translate_title and translated_title and not is_english(translated_title):
+                title = translated_title
+                is_translated = True
 
         if summary and len(summary) > 300:
             summary = summary[:297] + "..."
@@ -290,10 +555,7 @@ You MUST return ONLY a valid JSON object:
 
     async def summarize_item(self, item: NewsItem) -> str:
         """Generate a concise summary for a single news item (Chinese content)."""
-        content_to_summarize = item.content if item.content and len(item.content) > len(item.summary or "") else (item.summary or "无")
-
-        if len(content_to_summarize) > 10000:
-            content_to_summarize = content_to_summarize[:10000] + "..."
+        content_to_summarize = _clip_content(item) or "无"
 
         prompt = f"""You are a professional tech news editor. Summarize the following news item.
 
@@ -316,18 +578,15 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
 """
 
         try:
-            text_response = _clean_json_response(await self._call(prompt, json_mode=True))
+            text_response = await self._call(prompt, schema=_SUMMARY_SCHEMA)
+            data = _parse_json_response(text_response)
+            if data is None:
+                print(f"JSON Parse Error for '{item.title}': {_clean_json_response(text_response)[:50]}...")
+                return item.summary or ""
 
-            try:
-                data = json.loads(text_response)
-                if not data.get("is_relevant", True):
-                    return "IRRELEVANT"
-                return data.get("summary", "").strip()
-            except json.JSONDecodeError:
-                result = text_response.replace('```', '').strip()
-                if "IRRELEVANT" in result.upper():
-                    return "IRRELEVANT"
-                return result
+            if not data.get("is_relevant", True):
+                return "IRRELEVANT"
+            return _LABEL_PREFIX_RE.sub('', data.get("summary", "").strip(), count=1)
 
         except Exception as e:
             print(f"Summarize error: {e}")
@@ -344,14 +603,11 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
     ) -> str:
         """Generate overall daily highlights summary with HTML formatting."""
 
-        content_parts = []
-        for category, items in items_by_category.items():
-            cat_name = category_names.get(category, category)
-            content_parts.append(f"\n## {cat_name}")
-            for item in items[:5]:
-                content_parts.append(f"- {item.title} ({item.source})")
-
-        all_content = "\n".join(content_parts)
+        all_content = "\n".join(
+            f"\n## {category_names.get(category, category)}"
+            + "".join(f"\n- {item.title} ({item.source})" for item in islice(items, 5))
+            for category, items in items_by_category.items()
+        )
 
         prompt = f"""You are an AI industry analyst. Based on the following news list, select the top 3 most important news items for today.
 
@@ -373,29 +629,28 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
 """
 
         try:
-            text_response = _clean_json_response(await self._call(prompt, json_mode=True))
-
-            try:
-                data = json.loads(text_response)
-                highlights_list = data.get("highlights", [])
+            text_response = await self._call(prompt, schema=_HIGHLIGHTS_SCHEMA)
+            data = _parse_json_response(text_response)
+            if data is None:
+                text_response = _clean_json_response(text_response)
+                print(f"JSON Parse Error for highlights: {text_response[:50]}...")
+                return self._format_highlights_html(text_response)
 
-                html_parts = []
-                for i, highlight in enumerate(highlights_list, 1):
-                    clean_highlight = re.sub(r'^(AI[:：]\s*(YES|NO|Related)|Title:|Summary:).*?[:：]\s*', '', highlight, flags=re.IGNORECASE).strip()
-                    if clean_highlight:
-                        html_parts.append(
-                            f'<div class="highlight-item">'
-                            f'<span class="highlight-number">{i}</span>'
-                            f'<span class="highlight-text">{clean_highlight}</span>'
-                            f'</div>'
-                        )
+            highlights_list = data.get("highlights", [])
 
-                if html_parts:
-                    return '\n'.join(html_parts)
+            html_parts = []
+            for i, highlight in enumerate(highlights_list, 1):
+                clean_highlight = _HIGHLIGHT_PREFIX_RE.sub('', highlight).strip()
+                if clean_highlight:
+                    html_parts.append(
+                        f'<div class="highlight-item">'
+                        f'<span class="highlight-number">{i}</span>'
+                        f'<span class="highlight-text">{clean_highlight}</span>'
+                        f'</div>'
+                    )
 
-            except json.JSONDecodeError:
-                print(f"JSON Parse Error for highlights: {text_response[:50]}...")
-                return self._format_highlights_html(text_response)
+            if html_parts:
+                return '\n'.join(html_parts)
 
             return "今日AI动态收集完成，请查看下方详情。"
 
@@ -407,8 +662,7 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
         """将要点文本转换为HTML格式。"""
         html_parts = []
 
-        pattern_num = r'(\d+)[.、．]\s*'
-        parts_num = re.split(pattern_num, text)
+        parts_num = _NUM_SPLIT_RE.split(text)
 
         if len(parts_num) > 1:
             i = 1
@@ -433,7 +687,7 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
                 line = line.strip()
                 if not line:
                     continue
-                clean_line = re.sub(r'^[-*•]\s*', '', line)
+                clean_line = _BULLET_RE.sub('', line)
                 if clean_line:
                     html_parts.append(
                         f'<div class="highlight-item">'
@@ -452,32 +706,35 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
     #  批量处理
     # ──────────────────────────────────────────────
 
+    async def _summarize_as_completed(self, items: list[NewsItem]):
+        """并发执行 summarize_and_translate，按完成顺序产出 (下标, 结果或异常)。"""
+        async def run(index: int, item: NewsItem):
+            try:
+                return index, await self.summarize_and_translate(item)
+            except Exception as e:
+                return index, e
+
+        for fut in asyncio.as_completed([run(i, item) for i, item in enumerate(items)]):
+            yield await fut
+
     async def process_items_with_translation(
         self,
         items: list[NewsItem],
         max_items: int = 30
     ) -> list[NewsItem]:
         """处理新闻项：翻译英文内容并生成摘要 (Parallel)."""
-        tasks = []
-        for item in items[:max_items]:
-            tasks.append(self.summarize_and_translate(item))
+        items = items[:max_items]
+        processed: dict[int, NewsItem] = {}
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        processed_items = []
-        for i, result in enumerate(results):
+        async for i, result in self._summarize_as_completed(items):
+            item = items[i]
             if isinstance(result, tuple):
-                title, summary, is_translated = result
-                item = items[i]
-                item.title = title
-                item.summary = summary
-                item.is_translated = is_translated
-                processed_items.append(item)
+                item.title, item.summary, item.is_translated = result
             elif isinstance(result, Exception):
-                print(f"Error processing item {items[i].title}: {result}")
-                processed_items.append(items[i])
+                print(f"Error processing item {item.title}: {result}")
+            processed[i] = item
 
-        return processed_items
+        return [processed[i] for i in sorted(processed)]
 
     async def process_and_filter_items(
         self,
@@ -490,21 +747,28 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
         """
         print(f"🌐 Translating {len(items)} items...")
 
-        tasks = []
-        for item in items:
-            tasks.append(self.summarize_and_translate(item))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        valid_items = []
+        # 按完成顺序逐条处理（日志即时输出），最终仍按原顺序返回
+        kept: dict[int, NewsItem] = {}
         translated_count = 0
 
-        for i, result in enumerate(results):
+        # 已是中文的短摘要直接保留，只把其余条目交给 Gemini
+        pending: list[int] = []
+        for i, item in enumerate(items):
+            if CHINESE_SUMMARY_FAST_PATH and _is_chinese_passthrough(item):
+                item.is_translated = False
+                kept[i] = item
+            else:
+                pending.append(i)
+        if kept:
+            print(f"   ⏩ {len(kept)} Chinese items kept as-is")
+
+        async for j, result in self._summarize_as_completed([items[i] for i in pending]):
+            i = pending[j]
             item = items[i]
 
             if isinstance(result, Exception):
                 print(f"   Translation error for '{item.title[:30]}...': {result}")
-                valid_items.append(item)
+                kept[i] = item
                 continue
 
             title, summary, is_translated = result
@@ -523,7 +787,9 @@ You MUST return ONLY a valid JSON object matching this schema exactly:
             if is_translated:
                 translated_count += 1
 
-            valid_items.append(item)
+            kept[i] = item
+
+        valid_items = [kept[i] for i in sorted(kept)]
 
         print(f"   Translated {translated_count} items (Filtered {len(items) - len(valid_items)} irrelevant)\n")
         return valid_items, translated_count
@@ -569,9 +835,9 @@ Each sub-array should contain the index numbers of news items reporting on the s
 """
 
         try:
-            text_response = _clean_json_response(await self._call(prompt, json_mode=True))
-
-            data = json.loads(text_response)
+            data = _parse_json_response(await self._call(prompt, schema=_GROUPS_SCHEMA))
+            if data is None:
+                raise ValueError("invalid JSON response")
             groups = data.get("groups", [])
 
             if not groups:
@@ -2,10 +2,64 @@
 import os
 import re
 import json
+import logging
+import time
+import random
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_HTML_RE = re.compile(r'<[^>]+>')
+
+# Feishu block type to block body key
+_BLOCK_TYPE_NAME = {
+    2: "text",
+    3: "heading1",
+    4: "heading2",
+    5: "heading3",
+    12: "bullet",
+    13: "ordered"
+}
+
+# One pass per markdown line: optional block prefix, then the body text.
+# "## " maps to Heading 2 and "### " to Heading 3 in Feishu for aesthetics;
+# any other matched prefix is a numbered list item.
+_LINE_RE = re.compile(r'(?P<prefix>## |### |[-*] |\d+\.\s)?(?P<body>.*)', re.DOTALL)
+_PREFIX_BLOCK_TYPE = {"## ": 4, "### ": 5, "- ": 12, "* ": 12}
+
+# Feishu "request too frequent" error codes returned with HTTP 200/400
+_RATE_LIMIT_CODES = {99991400, 11232}
+# Tenant access token invalid / expired; refreshed once and the call retried
+_AUTH_EXPIRED_CODES = {99991663, 99991664}
+
+
+def _json_dumps(obj) -> str:
+    """Serialize request bodies and card content compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class FeishuAPIError(Exception):
+    """A Feishu API call that returned a non-zero response code."""
+
+    def __init__(self, code, msg: str):
+        super().__init__(f"{msg} (code {code})")
+        self.code = code
+        self.msg = msg
+
 
 class FeishuPublisher:
     """Publish content to Feishu (Lark) Cloud Documents."""
@@ -15,8 +69,28 @@ class FeishuPublisher:
     ADMIN_OPEN_ID = "ou_a56b76d66880b915708fab278df0c527"
     # Document retention period in days
     RETENTION_DAYS = 180
-    # Path to store document records
-    DOCUMENTS_DB = Path(__file__).parent.parent / "data" / "documents.json"
+    # Path to store document records (append-only JSON Lines, one record per line;
+    # a legacy documents.json next to it is migrated on first access)
+    DOCUMENTS_DB = Path(__file__).parent.parent / "data" / "documents.jsonl"
+    # Seconds to wait after a record before writing, so several records share one write
+    DOCS_FLUSH_DELAY = 2
+    # Max concurrent deletions during retention cleanup
+    CLEANUP_CONCURRENCY = 10
+    # Tenant token persisted across runs (owner-only permissions)
+    TOKEN_CACHE = Path(__file__).parent.parent / "data" / ".feishu_token.json"
+    # Seconds before token expiry during which the cached token is still served
+    # while a background refresh fetches a new one
+    TOKEN_STALE_WINDOW = 300
+    # Per-request limits for appending children blocks
+    WRITE_BATCH_BLOCKS = 50
+    WRITE_BATCH_MAX_BYTES = 1_000_000
+    # Attempts per POST when rate limited (HTTP 429 / rate-limit code) or on 5xx
+    MAX_ATTEMPTS = 5
+    # Total seconds per request: JSON API calls vs. file uploads of up to 20MB
+    API_TIMEOUT = 60
+    UPLOAD_TIMEOUT = 300
+    # Max distinct (text, block_type) entries memoized by _create_block
+    BLOCK_CACHE_SIZE = 256
 
     def __init__(self):
         self.app_id = os.environ.get("FEISHU_APP_ID", "").strip()
@@ -24,36 +98,231 @@ class FeishuPublisher:
         # Folder token (optional, not used if can't add app as collaborator)
         self.folder_token = os.environ.get("FEISHU_FOLDER_TOKEN", "").strip()
         self._tenant_access_token = None
-        self._token_expiry = 0
+        # Monotonic deadline after which the token must not be used
+        self._token_expiry = 0.0
+        # Serializes token refresh so concurrent callers share one auth request
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._block_cache: dict[tuple[str, int], dict] = {}
+        # Last parsed markdown and built card, reused when called again with the same input
+        self._blocks_memo: Optional[tuple[str, list[dict]]] = None
+        self._card_memo: Optional[tuple[tuple, dict]] = None
+        # Document records: loaded from DOCUMENTS_DB on first use, new records
+        # queue in _pending_docs until the debounced flush writes them
+        self._docs: Optional[list[dict]] = None
+        self._pending_docs: list[dict] = []
+        self._docs_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
     def is_configured(self) -> bool:
         """Check if Feishu credentials are present."""
         return bool(self.app_id and self.app_secret)
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        All calls go to open.feishu.cn, so one pooled session keeps the
+        TCP/TLS connection alive across auth, docx, drive and im requests.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.API_TIMEOUT),
+                json_serialize=_json_dumps,
+            )
+        return self._session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Flush document records, cancel background work and close the shared HTTP session."""
+        if self._flush_task:
+            # Only interrupts the debounce sleep; a write already under way is shielded
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self._flush_docs()
+
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _send_request(self, method: str, url: str, *, json_body: dict = None,
+                            data=None, headers: dict = None, idempotent: bool = True,
+                            timeout: float = None) -> dict:
+        """Send one request and return the parsed response body.
+
+        Rate limits are retried with exponential backoff, honoring
+        Retry-After when Feishu sends it. Server errors (5xx) are only
+        retried for idempotent calls: a 502/504 may arrive after Feishu has
+        applied the request, so repeating a create/append/send could
+        duplicate it. data may be a callable returning a fresh multipart
+        body, since a FormData is consumed by the attempt that sends it.
+        timeout overrides the session's API_TIMEOUT, in seconds.
+        """
+        session = await self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.API_TIMEOUT)
+        delay = 1.0
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            body = data() if callable(data) else data
+            async with session.request(method, url, json=json_body, data=body, headers=headers,
+                                       timeout=client_timeout) as response:
+                result = None
+                server_error = response.status >= 500
+                retryable = response.status == 429 or (idempotent and server_error)
+                if not retryable and not server_error:
+                    result = await response.json(loads=_json_loads, content_type=None)
+                    retryable = result.get("code") in _RATE_LIMIT_CODES
+                if not retryable or attempt == self.MAX_ATTEMPTS:
+                    if result is None:
+                        raise Exception(f"Feishu HTTP {response.status}: {await response.text()}")
+                    return result
+                retry_after = response.headers.get("Retry-After", "")
+
+            wait = float(retry_after) if retry_after.isdigit() else delay
+            logger.warning("   ⏳ Feishu rate limited / unavailable, retrying in %.0fs...", wait)
+            await asyncio.sleep(min(wait, 30) + random.random() * 0.2)
+            delay = min(delay * 2, 30)
+
+    async def _request(self, method: str, url: str, *, json_body: dict = None, data=None,
+                       idempotent: bool = True, timeout: float = None) -> dict:
+        """Call an authenticated Feishu API and return its "data" payload.
+
+        Raises FeishuAPIError on a non-zero response code. If the tenant
+        token was rejected as invalid or expired, it is refreshed and the
+        call retried once. Pass idempotent=False for calls that must not be
+        repeated after a server error (see _send_request).
+        """
+        for attempt in range(2):
+            token = await self._get_tenant_access_token()
+            headers = {"Authorization": f"Bearer {token}"}
+            result = await self._send_request(method, url, json_body=json_body, data=data,
+                                              headers=headers, idempotent=idempotent,
+                                              timeout=timeout)
+            code = result.get("code")
+            if code == 0:
+                return result.get("data") or {}
+            if code in _AUTH_EXPIRED_CODES and attempt == 0:
+                # Drop the rejected token unless another call already replaced it
+                if self._tenant_access_token == token:
+                    self._token_expiry = 0.0
+                continue
+            raise FeishuAPIError(code, result.get("msg", ""))
+
     async def _get_tenant_access_token(self) -> str:
-        """Get or refresh tenant access token."""
-        if self._tenant_access_token and datetime.now().timestamp() < self._token_expiry:
-            return self._tenant_access_token
+        """Get or refresh tenant access token.
 
+        A fresh token is returned directly. A stale one (inside
+        TOKEN_STALE_WINDOW of expiry) is still returned while a background
+        task refreshes it, so only a missing or expired token blocks.
+        """
+        if self._tenant_access_token:
+            ttl = self._token_expiry - time.monotonic()
+            if ttl > self.TOKEN_STALE_WINDOW:
+                return self._tenant_access_token
+            if ttl > 0:
+                if self._refresh_task is None or self._refresh_task.done():
+                    self._refresh_task = asyncio.create_task(self._background_refresh())
+                return self._tenant_access_token
+
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited for the lock
+            if self._tenant_access_token and time.monotonic() < self._token_expiry:
+                return self._tenant_access_token
+            # A fresh process may reuse the token saved by a previous run
+            if self._tenant_access_token is None and await self._load_cached_token():
+                return self._tenant_access_token
+            return await self._refresh_token()
+
+    async def _load_cached_token(self) -> bool:
+        """Load a still-fresh token saved by a previous run, if any."""
+        cached = await asyncio.to_thread(self._read_token_cache_sync)
+        if not cached:
+            return False
+
+        if cached.get("app_id") != self.app_id:
+            return False
+        # Saved expiry is wall-clock; convert the remaining lifetime to monotonic
+        remaining = cached.get("expiry", 0) - time.time()
+        if remaining <= self.TOKEN_STALE_WINDOW or not cached.get("token"):
+            return False
+
+        self._tenant_access_token = cached["token"]
+        self._token_expiry = time.monotonic() + remaining
+        return True
+
+    def _read_token_cache_sync(self) -> Optional[dict]:
+        """Read the token cache file; None if missing or unreadable."""
+        try:
+            with open(self.TOKEN_CACHE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    async def _save_cached_token(self, expires_in: float):
+        """Atomically persist the current token for later runs."""
+        record = {
+            "app_id": self.app_id,
+            "token": self._tenant_access_token,
+            "expiry": time.time() + expires_in,
+        }
+        try:
+            await asyncio.to_thread(self._write_token_cache_sync, record)
+        except OSError as e:
+            logger.warning("   ⚠️ Could not cache Feishu token: %s", e)
+
+    def _write_token_cache_sync(self, record: dict):
+        """Write the token cache owner-only, via a temp file and rename."""
+        self.TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.TOKEN_CACHE.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp, self.TOKEN_CACHE)
+
+    async def _background_refresh(self):
+        """Refresh a stale token off the critical path."""
+        async with self._token_lock:
+            if self._token_expiry - time.monotonic() > self.TOKEN_STALE_WINDOW:
+                return
+            try:
+                await self._refresh_token()
+            except Exception as e:
+                # The stale token stays usable; the next caller retries once it expires
+                logger.warning("   ⚠️ Background token refresh failed: %s", e)
+
+    async def _refresh_token(self) -> str:
+        """Fetch a new tenant access token. Caller must hold _token_lock."""
         url = f"{self.BASE_URL}/auth/v3/tenant_access_token/internal"
         payload = {
             "app_id": self.app_id,
             "app_secret": self.app_secret
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as response:
-                if response.status != 200:
-                    raise Exception(f"Feishu Auth Failed: {await response.text()}")
-
-                data = await response.json()
-                if data.get("code") != 0:
-                    raise Exception(f"Feishu Auth Error: {data.get('msg')}")
+        data = await self._send_request("POST", url, json_body=payload)
+        if data.get("code") != 0:
+            raise FeishuAPIError(data.get("code"), f"Feishu Auth Error: {data.get('msg')}")
 
-                self._tenant_access_token = data["tenant_access_token"]
-                # Expires in 2 hours, refresh slightly earlier
-                self._token_expiry = datetime.now().timestamp() + data["expire"] - 300
-                return self._tenant_access_token
+        self._tenant_access_token = data["tenant_access_token"]
+        # Expires in 2 hours; keep a small margin for request latency
+        expires_in = data["expire"] - 30
+        self._token_expiry = time.monotonic() + expires_in
+        await self._save_cached_token(expires_in)
+        return self._tenant_access_token
 
     async def set_document_public_permission(self, doc_token: str, chat_id: str = None) -> bool:
         """Set document permission to allow group members to read and add admin.
@@ -65,54 +334,55 @@ class FeishuPublisher:
         Returns:
             True if successful, False otherwise
         """
-        token = await self._get_tenant_access_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        return await self._grant_members(doc_token, "docx", "document", chat_id)
 
-        members_url = f"{self.BASE_URL}/drive/v1/permissions/{doc_token}/members?type=docx&need_notification=false"
-        success = False
+    async def _grant_members(self, obj_token: str, obj_type: str, label: str, chat_id: str = None) -> bool:
+        """Add the admin (full access) and the chat group (view) as collaborators.
+
+        The two member POSTs are independent, so they are sent concurrently.
 
+        Args:
+            obj_token: Token of the document or file
+            obj_type: Drive permission type ("docx" or "file")
+            label: Name used in log messages ("document" or "file")
+            chat_id: Optional chat_id to add as viewer
+
+        Returns:
+            True if at least one member was added
+        """
+        members_url = f"{self.BASE_URL}/drive/v1/permissions/{obj_token}/members?type={obj_type}&need_notification=false"
+
+        members = []
         # Add admin user with full access
         if self.ADMIN_OPEN_ID:
-            admin_payload = {
+            members.append(("admin", {
                 "member_type": "openid",
                 "member_id": self.ADMIN_OPEN_ID,
                 "perm": "full_access"
-            }
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(members_url, json=admin_payload, headers=headers) as response:
-                        data = await response.json()
-                        if data.get("code") == 0:
-                            print(f"   ✅ Added admin with full_access")
-                            success = True
-                        else:
-                            print(f"   ⚠️ Add admin warning: {data.get('msg', '')}")
-            except Exception as e:
-                print(f"   ⚠️ Add admin error: {e}")
-
+            }))
         # Add chat group as viewer
         if chat_id:
-            member_payload = {
+            members.append(("chat", {
                 "member_type": "openchat",
                 "member_id": chat_id,
                 "perm": "view"
-            }
+            }))
 
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(members_url, json=member_payload, headers=headers) as response:
-                        data = await response.json()
-                        if data.get("code") == 0:
-                            print(f"   ✅ Added chat group as document viewer")
-                            success = True
-                        else:
-                            error_msg = data.get('msg', '')
-                            print(f"   ⚠️ Add chat member warning: {error_msg}")
-            except Exception as e:
-                print(f"   ⚠️ Add member error: {e}")
+        results = await asyncio.gather(
+            *(self._request("POST", members_url, json_body=payload) for _, payload in members),
+            return_exceptions=True,
+        )
+
+        success = False
+        for (who, _), result in zip(members, results):
+            if isinstance(result, Exception):
+                logger.warning("   ⚠️ Add %s to %s error: %s", who, label, result)
+            else:
+                if who == "admin":
+                    logger.debug("   ✅ Added admin with full_access to %s", label)
+                else:
+                    logger.debug("   ✅ Added chat group as %s viewer", label)
+                success = True
 
         return success
 
@@ -125,24 +395,18 @@ class FeishuPublisher:
         Returns:
             True if deleted successfully, False otherwise
         """
-        token = await self._get_tenant_access_token()
-        headers = {"Authorization": f"Bearer {token}"}
-
         # The API is generic for files, type param is optional but safer to omit for generic files
         url = f"{self.BASE_URL}/drive/v1/files/{doc_token}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=headers) as response:
-                    data = await response.json()
-                    if data.get("code") == 0:
-                        print(f"   ✅ Deleted file/document: {doc_token}")
-                        return True
-                    else:
-                        print(f"   ❌ Delete failed: {data.get('msg', '')}")
-                        return False
+            await self._request("DELETE", url)
+            logger.debug("   ✅ Deleted file/document: %s", doc_token)
+            return True
+        except FeishuAPIError as e:
+            logger.error("   ❌ Delete failed: %s", e.msg)
+            return False
         except Exception as e:
-            print(f"   ❌ Delete error: {e}")
+            logger.error("   ❌ Delete error: %s", e)
             return False
 
     async def list_app_documents(self) -> list:
@@ -151,31 +415,21 @@ class FeishuPublisher:
         Returns:
             List of document info dicts
         """
-        token = await self._get_tenant_access_token()
-        headers = {"Authorization": f"Bearer {token}"}
-
         # List files in app's root folder
         url = f"{self.BASE_URL}/drive/v1/files?folder_token=&order_by=EditedTime&direction=DESC&page_size=50"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    data = await response.json()
-                    if data.get("code") == 0:
-                        files = data.get("data", {}).get("files", [])
-                        return files
-                    else:
-                        print(f"   ⚠️ List files error: {data.get('msg', '')}")
-                        return []
+            data = await self._request("GET", url)
+            return data.get("files", [])
+        except FeishuAPIError as e:
+            logger.warning("   ⚠️ List files error: %s", e.msg)
+            return []
         except Exception as e:
-            print(f"   ⚠️ List error: {e}")
+            logger.warning("   ⚠️ List error: %s", e)
             return []
 
     async def create_document(self, title: str) -> str:
         """Create a new Docx and return its document_id."""
-        token = await self._get_tenant_access_token()
-        headers = {"Authorization": f"Bearer {token}"}
-
         # If folder_token is set, create in folder using Drive API
         if self.folder_token:
             url = f"{self.BASE_URL}/drive/v1/files/create_docx"
@@ -190,117 +444,128 @@ class FeishuPublisher:
                 "title": title
             }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                data = await response.json()
-                if data.get("code") != 0:
-                    raise Exception(f"Create Doc Error: {data.get('msg')}")
-
-                # Drive API returns 'file_token' inside 'file', Docx API returns 'document_id' inside 'document'
-                # Both are nested inside 'data'
-                res_data = data.get("data", {})
-                if "file" in res_data: # Drive API response
-                    # For Docx created via Drive API, file_token == document_id
-                    return res_data["file"]["token"]
-                elif "document" in res_data: # Docx API response
-                    return res_data["document"]["document_id"]
-                else:
-                    raise Exception(f"Unknown response format: {data}")
+        try:
+            res_data = await self._request("POST", url, json_body=payload, idempotent=False)
+        except FeishuAPIError as e:
+            raise FeishuAPIError(e.code, f"Create Doc Error: {e.msg}") from e
+
+        # Drive API returns 'file_token' inside 'file', Docx API returns 'document_id' inside 'document'
+        # Both are nested inside 'data'
+        if "file" in res_data: # Drive API response
+            # For Docx created via Drive API, file_token == document_id
+            return res_data["file"]["token"]
+        elif "document" in res_data: # Docx API response
+            return res_data["document"]["document_id"]
+        else:
+            raise Exception(f"Unknown response format: {res_data}")
 
     def _markdown_to_blocks(self, content: str) -> list[dict]:
         """Parse simple Markdown to Feishu Block structure."""
-        blocks = []
-        lines = content.split('\n')
+        if self._blocks_memo and self._blocks_memo[0] == content:
+            return self._blocks_memo[1]
 
-        for line in lines:
+        blocks = []
+        # Bound once: these run for every line of the digest
+        append = blocks.append
+        create_block = self._create_block
+        match_line = _LINE_RE.match
+        # Elements of the text block that the next plain line may continue;
+        # copied on first merge so blocks shared via _block_cache stay untouched
+        paragraph: Optional[list] = None
+        paragraph_owned = False
+
+        for line in content.splitlines():
             line = line.strip()
             if not line:
+                paragraph = None
                 continue
 
-            # Heading 1 (##) - Map to Heading 2 in Feishu for aesthetics
-            if line.startswith("## "):
-                text = line[3:]
-                blocks.append(self._create_block(text, block_type=4)) # Heading 2
-
-            # Heading 2 (###) - Map to Heading 3
-            elif line.startswith("### "):
-                text = line[4:]
-                blocks.append(self._create_block(text, block_type=5)) # Heading 3
-
-            # Bullet list
-            elif line.startswith("- ") or line.startswith("* "):
-                text = line[2:]
-                blocks.append(self._create_block(text, block_type=12)) # Bullet
-
-            # Numbered list (simple regex)
-            elif re.match(r'^\d+\.\s', line):
-                text = re.sub(r'^\d+\.\s', '', line)
-                blocks.append(self._create_block(text, block_type=13)) # Numbered
-
-            # Default text
+            match = match_line(line)
+            prefix = match["prefix"]
+            if prefix is None:
+                block_type = 2 # Text
             else:
-                blocks.append(self._create_block(line, block_type=2)) # Text
+                line = match["body"]
+                block_type = _PREFIX_BLOCK_TYPE.get(prefix, 13) # Numbered
+
+            block = create_block(line, block_type)
+
+            # Consecutive plain lines form one paragraph: join them into a single
+            # text block with line breaks instead of one block per line
+            if block_type != 2:
+                paragraph = None
+            elif paragraph is None:
+                paragraph = block["text"]["elements"]
+                paragraph_owned = False
+            else:
+                if not paragraph_owned:
+                    paragraph = list(paragraph)
+                    paragraph_owned = True
+                    blocks[-1] = {"block_type": 2, "text": {"elements": paragraph}}
+                paragraph.append({"text_run": {"content": "\n"}})
+                paragraph.extend(block["text"]["elements"])
+                continue
+
+            append(block)
 
+        self._blocks_memo = (content, blocks)
         return blocks
 
     def _create_block(self, text: str, block_type: int) -> dict:
+        """Create a block object, reusing the result for repeated lines.
+
+        Blocks are only serialized into request bodies and never mutated,
+        so identical lines (footers, separators) can share one dict.
+        """
+        key = (text, block_type)
+        block = self._block_cache.get(key)
+        if block is None:
+            block = self._build_block(text, block_type)
+            if len(self._block_cache) < self.BLOCK_CACHE_SIZE:
+                self._block_cache[key] = block
+        return block
+
+    def _build_block(self, text: str, block_type: int) -> dict:
         """Create a block object with text elements handling links."""
-        # Simple link parsing: [text](url)
-        elements = []
-        pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-
-        # Iterate and find links
-        last_idx = 0
-        for match in re.finditer(pattern, text):
-            # Text before link
-            if match.start() > last_idx:
-                elements.append({
+        # Simple link parsing: [text](url); lines without "](" cannot hold a link
+        if "](" not in text:
+            elements = [{"text_run": {"content": text}}]
+        else:
+            elements = []
+            append = elements.append
+            last_idx = 0
+            for match in _LINK_RE.finditer(text):
+                # Text before link
+                if match.start() > last_idx:
+                    append({
+                        "text_run": {
+                            "content": text[last_idx:match.start()]
+                        }
+                    })
+
+                # Link
+                link_text = match.group(1)
+                link_url = match.group(2)
+                append({
                     "text_run": {
-                        "content": text[last_idx:match.start()]
+                        "content": link_text,
+                        "text_element_style": {
+                            "link": {"url": link_url}
+                        }
                     }
                 })
 
-            # Link
-            link_text = match.group(1)
-            link_url = match.group(2)
-            elements.append({
-                "text_run": {
-                    "content": link_text,
-                    "text_element_style": {
-                        "link": {"url": link_url}
-                    }
-                }
-            })
-
-            last_idx = match.end()
-
-        # Remaining text
-        if last_idx < len(text):
-            elements.append({
-                "text_run": {
-                    "content": text[last_idx:]
-                }
-            })
-
-        # If no elements were created (empty text), add empty text_run
-        if not elements:
-            elements.append({
-                "text_run": {
-                    "content": text
-                }
-            })
+                last_idx = match.end()
 
-        # Block type to key mapping
-        type_mapping = {
-            2: "text",
-            3: "heading1",
-            4: "heading2",
-            5: "heading3",
-            12: "bullet",
-            13: "ordered"
-        }
+            # Remaining text
+            if last_idx < len(text):
+                append({
+                    "text_run": {
+                        "content": text[last_idx:]
+                    }
+                })
 
-        type_name = type_mapping.get(block_type, "text")
+        type_name = _BLOCK_TYPE_NAME.get(block_type, "text")
 
         return {
             "block_type": block_type,
@@ -311,21 +576,33 @@ class FeishuPublisher:
 
     async def write_content(self, document_id: str, blocks: list[dict]):
         """Append blocks to the document."""
-        token = await self._get_tenant_access_token()
         url = f"{self.BASE_URL}/docx/v1/documents/{document_id}/blocks/{document_id}/children"
-        headers = {"Authorization": f"Bearer {token}"}
-
-        # Feishu has limits on block creation (e.g. 50 at a time)
-        batch_size = 50
-        for i in range(0, len(blocks), batch_size):
-            batch = blocks[i:i+batch_size]
-            payload = {"children": batch}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, headers=headers) as response:
-                    data = await response.json()
-                    if data.get("code") != 0:
-                        print(f"Error writing blocks batch {i}: {data.get('msg')}")
+        # Feishu limits each children request by block count and body size;
+        # close a batch at whichever limit is reached first
+        batches: list[list[dict]] = []
+        batch: list[dict] = []
+        batch_bytes = 0
+        for block in blocks:
+            block_bytes = len(_json_dumps(block).encode())
+            if batch and (len(batch) == self.WRITE_BATCH_BLOCKS
+                          or batch_bytes + block_bytes > self.WRITE_BATCH_MAX_BYTES):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(block)
+            batch_bytes += block_bytes
+        if batch:
+            batches.append(batch)
+
+        # Batches append in order (Feishu only accepts an insert index up to the
+        # current child count), and a failed batch aborts the publish, so stop
+        # at the first failure instead of writing the rest after a gap
+        for i, batch in enumerate(batches):
+            try:
+                await self._request("POST", url, json_body={"children": batch}, idempotent=False)
+            except Exception as e:
+                logger.error("Error writing blocks batch %s: %s", i, e)
+                raise Exception(f"Block batch {i + 1}/{len(batches)} failed to write; stopped") from e
 
     async def upload_file(self, file_path: str, file_name: str = None, parent_type: str = "explorer") -> dict:
         """Upload a file to Feishu Drive.
@@ -343,50 +620,46 @@ class FeishuPublisher:
             Dict with file_token and url, or None on failure
         """
         if not self.is_configured():
-            print("Feishu publisher not configured (missing APP_ID/SECRET)")
+            logger.info("Feishu publisher not configured (missing APP_ID/SECRET)")
             return None
 
-        token = await self._get_tenant_access_token()
-
         if not file_name:
             file_name = Path(file_path).name
 
-        # Get file size
-        file_size = Path(file_path).stat().st_size
-
         url = f"{self.BASE_URL}/drive/v1/files/upload_all"
-        headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            with open(file_path, "rb") as f:
+            # Read off the event loop; upload_all caps files at 20MB, so the
+            # body fits in memory and its length doubles as the size field
+            body = await asyncio.to_thread(Path(file_path).read_bytes)
+
+            def build_form() -> aiohttp.FormData:
                 # Use FormData for multipart upload
                 form_data = aiohttp.FormData()
                 form_data.add_field("file_name", file_name)
                 form_data.add_field("parent_type", parent_type)
                 form_data.add_field("parent_node", self.folder_token or "")
-                form_data.add_field("size", str(file_size))
-                form_data.add_field("file", f, filename=file_name, content_type="application/pdf")
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(url, data=form_data, headers=headers) as response:
-                        data = await response.json()
-                        if data.get("code") != 0:
-                            msg = data.get('msg')
-                            print(f"   ❌ Upload failed: {msg}")
-                            if "permission" in str(msg).lower() or "access denied" in str(msg).lower():
-                                print("   💡 Check permissions: 'drive:drive' or 'drive:file:upload' is required.")
-                                print("   💡 Remember to release a new version of your app after adding permissions!")
-                            return None
-
-                        file_token = data.get("data", {}).get("file_token")
-                        if file_token:
-                            file_url = f"https://feishu.cn/file/{file_token}"
-                            print(f"   ✅ File uploaded: {file_url}")
-                            return {"file_token": file_token, "url": file_url}
-                        return None
+                form_data.add_field("size", str(len(body)))
+                form_data.add_field("file", body, filename=file_name, content_type="application/pdf")
+                return form_data
+
+            data = await self._request("POST", url, data=build_form, idempotent=False,
+                                       timeout=self.UPLOAD_TIMEOUT)
+            file_token = data.get("file_token")
+            if file_token:
+                file_url = f"https://feishu.cn/file/{file_token}"
+                logger.info("   ✅ File uploaded: %s", file_url)
+                return {"file_token": file_token, "url": file_url}
+            return None
 
+        except FeishuAPIError as e:
+            logger.error("   ❌ Upload failed: %s", e.msg)
+            if "permission" in e.msg.lower() or "access denied" in e.msg.lower():
+                logger.info("   💡 Check permissions: 'drive:drive' or 'drive:file:upload' is required.")
+                logger.info("   💡 Remember to release a new version of your app after adding permissions!")
+            return None
         except Exception as e:
-            print(f"   ❌ Upload error: {e}")
+            logger.error("   ❌ Upload error: %s", e)
             return None
 
     async def set_file_permission(self, file_token: str, chat_id: str = None) -> bool:
@@ -399,55 +672,7 @@ class FeishuPublisher:
         Returns:
             True if successful
         """
-        token = await self._get_tenant_access_token()
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
-        members_url = f"{self.BASE_URL}/drive/v1/permissions/{file_token}/members?type=file&need_notification=false"
-        success = False
-
-        # Add admin user with full access
-        if self.ADMIN_OPEN_ID:
-            admin_payload = {
-                "member_type": "openid",
-                "member_id": self.ADMIN_OPEN_ID,
-                "perm": "full_access"
-            }
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(members_url, json=admin_payload, headers=headers) as response:
-                        data = await response.json()
-                        if data.get("code") == 0:
-                            print(f"   ✅ Added admin with full_access to file")
-                            success = True
-                        else:
-                            print(f"   ⚠️ Add admin to file warning: {data.get('msg', '')}")
-            except Exception as e:
-                print(f"   ⚠️ Add admin to file error: {e}")
-
-        # Add chat group as viewer
-        if chat_id:
-            member_payload = {
-                "member_type": "openchat",
-                "member_id": chat_id,
-                "perm": "view"
-            }
-
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(members_url, json=member_payload, headers=headers) as response:
-                        data = await response.json()
-                        if data.get("code") == 0:
-                            print(f"   ✅ Added chat group as file viewer")
-                            success = True
-                        else:
-                            print(f"   ⚠️ Add chat to file warning: {data.get('msg', '')}")
-            except Exception as e:
-                print(f"   ⚠️ Add chat to file error: {e}")
-
-        return success
+        return await self._grant_members(file_token, "file", "file", chat_id)
 
     async def upload_pdf(self, pdf_path: str, title: str, chat_id: str = None) -> str:
         """Upload PDF and set permissions.
@@ -461,30 +686,28 @@ class FeishuPublisher:
             URL to access the PDF, or None on failure
         """
         if not self.is_configured():
-            print("Feishu publisher not configured (missing APP_ID/SECRET)")
+            logger.info("Feishu publisher not configured (missing APP_ID/SECRET)")
             return None
 
         try:
-            print(f"📄 Uploading PDF to Feishu: {title}...")
+            logger.info("📄 Uploading PDF to Feishu: %s...", title)
             result = await self.upload_file(pdf_path, f"{title}.pdf")
+        except Exception as e:
+            logger.error("❌ PDF Upload Error: %s", e)
+            return None
 
-            if not result:
-                return None
-
-            file_token = result["file_token"]
+        if not result:
+            return None
 
-            # Set permissions
-            print("   Setting file permissions...")
-            await self.set_file_permission(file_token, chat_id)
+        file_token = result["file_token"]
 
-            # Record for cleanup
-            self._record_document(file_token, title)
+        # Record the file for cleanup, then grant access; grant failures are
+        # logged per member and never fail the upload
+        self._record_document(file_token, title)
+        logger.info("   Setting file permissions...")
+        await self.set_file_permission(file_token, chat_id)
 
-            return result["url"]
-
-        except Exception as e:
-            print(f"❌ PDF Upload Error: {e}")
-            return None
+        return result["url"]
 
     async def publish(self, title: str, markdown_content: str, chat_id: str = None) -> str:
         """Main method: Create doc and write content.
@@ -495,62 +718,130 @@ class FeishuPublisher:
             chat_id: Optional chat_id to grant read permission
         """
         if not self.is_configured():
-            print("Feishu publisher not configured (missing APP_ID/SECRET)")
+            logger.info("Feishu publisher not configured (missing APP_ID/SECRET)")
             return None
 
         try:
-            print(f"Creating Feishu document: {title}...")
+            logger.info("Creating Feishu document: %s...", title)
             doc_id = await self.create_document(title)
-
-            # Set document permission - try to add chat group as viewer
-            print("Setting document permissions...")
-            await self.set_document_public_permission(doc_id, chat_id)
-
-            print("Parsing content...")
-            blocks = self._markdown_to_blocks(markdown_content)
-
-            print(f"Writing {len(blocks)} blocks to document...")
-            await self.write_content(doc_id, blocks)
-
-            # Use the correct user-accessible document URL format
-            doc_url = f"https://feishu.cn/docx/{doc_id}"
-            print(f"✅ Published to Feishu: {doc_url}")
-
-            # Record document for future cleanup
-            self._record_document(doc_id, title)
-
-            return doc_url
-
         except Exception as e:
-            print(f"❌ Feishu Publish Error: {e}")
+            logger.error("❌ Feishu Publish Error: %s", e)
             return None
 
-    def _record_document(self, doc_token: str, title: str):
-        """Record document info for future cleanup."""
+        # Record document for future cleanup, even if writing it fails below
+        self._record_document(doc_id, title)
+
+        # Parse in a worker thread so a long digest doesn't stall the event loop
+        logger.info("Parsing content...")
+        blocks = await asyncio.to_thread(self._markdown_to_blocks, markdown_content)
+
+        # Permissions and block writes are independent, so they overlap. The
+        # grants log their own failures and never raise, so only a failed block
+        # write fails the publish (cancelling any grants still in flight).
+        logger.info("Setting document permissions...")
+        logger.info("Writing %s blocks to document...", len(blocks))
+        failed = False
         try:
-            # Ensure data directory exists
-            self.DOCUMENTS_DB.parent.mkdir(parents=True, exist_ok=True)
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.set_document_public_permission(doc_id, chat_id))
+                tg.create_task(self.write_content(doc_id, blocks))
+        except* Exception as eg:
+            failed = True
+            for e in eg.exceptions:
+                logger.error("❌ Feishu Publish Error: %s", e)
+
+        if failed:
+            return None
 
-            # Load existing records
-            if self.DOCUMENTS_DB.exists():
-                with open(self.DOCUMENTS_DB, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = {"documents": []}
+        # Use the correct user-accessible document URL format
+        doc_url = f"https://feishu.cn/docx/{doc_id}"
+        logger.info("✅ Published to Feishu: %s", doc_url)
 
-            # Add new record
-            data["documents"].append({
-                "token": doc_token,
-                "title": title,
-                "created_at": datetime.now().isoformat()
-            })
+        return doc_url
 
-            # Save
-            with open(self.DOCUMENTS_DB, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+    def _record_document(self, doc_token: str, title: str):
+        """Record document info for future cleanup.
 
+        The record is queued in memory and written by a debounced flush,
+        so publishing never waits on the documents file.
+        """
+        self._pending_docs.append({
+            "token": doc_token,
+            "title": title,
+            "created_at": datetime.now().isoformat()
+        })
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_docs_debounced())
+
+    async def _flush_docs_debounced(self):
+        await asyncio.sleep(self.DOCS_FLUSH_DELAY)
+        await asyncio.shield(self._flush_docs())
+
+    async def _flush_docs(self):
+        """Append queued document records to DOCUMENTS_DB."""
+        async with self._docs_lock:
+            if not self._pending_docs:
+                return
+            pending = list(self._pending_docs)
+            try:
+                await asyncio.to_thread(self._append_docs_sync, pending)
+            except Exception as e:
+                # Keep the queued records for the next flush
+                logger.warning("   ⚠️ Failed to record document: %s", e)
+                return
+            del self._pending_docs[:len(pending)]
+            if self._docs is not None:
+                self._docs.extend(pending)
+
+    async def _ensure_docs_loaded(self):
+        """Load document records once. Caller must hold _docs_lock."""
+        if self._docs is None:
+            self._docs = await asyncio.to_thread(self._read_docs_sync)
+
+    def _migrate_legacy_docs_sync(self):
+        """Convert a legacy {"documents": [...]} JSON file to JSON Lines."""
+        legacy = self.DOCUMENTS_DB.with_suffix(".json")
+        if legacy == self.DOCUMENTS_DB or not legacy.exists():
+            return
+        with open(legacy, 'r', encoding='utf-8') as f:
+            docs = json.load(f).get("documents", [])
+        if self.DOCUMENTS_DB.exists():
+            docs.extend(self._load_jsonl_sync())
+        self._write_docs_sync(docs)
+        legacy.unlink()
+
+    def _load_jsonl_sync(self) -> list[dict]:
+        with open(self.DOCUMENTS_DB, 'r', encoding='utf-8') as f:
+            return [_json_loads(line) for line in f if line.strip()]
+
+    def _read_docs_sync(self) -> list[dict]:
+        self._migrate_legacy_docs_sync()
+        if not self.DOCUMENTS_DB.exists():
+            return []
+        return self._load_jsonl_sync()
+
+    def _append_docs_sync(self, docs: list[dict]):
+        self._migrate_legacy_docs_sync()
+        # Ensure data directory exists
+        self.DOCUMENTS_DB.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.DOCUMENTS_DB, 'a', encoding='utf-8') as f:
+            f.write("".join(_json_dumps(doc) + "\n" for doc in docs))
+
+    async def _write_docs(self):
+        """Rewrite the records file from memory. Caller must hold _docs_lock."""
+        docs = list(self._docs)
+        try:
+            await asyncio.to_thread(self._write_docs_sync, docs)
         except Exception as e:
-            print(f"   ⚠️ Failed to record document: {e}")
+            logger.warning("   ⚠️ Failed to save document records: %s", e)
+
+    def _write_docs_sync(self, docs: list[dict]):
+        # Ensure data directory exists
+        self.DOCUMENTS_DB.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.DOCUMENTS_DB.with_suffix(".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write("".join(_json_dumps(doc) + "\n" for doc in docs))
+        os.replace(tmp, self.DOCUMENTS_DB)
 
     async def cleanup_old_documents(self) -> int:
         """Delete documents older than RETENTION_DAYS.
@@ -558,69 +849,75 @@ class FeishuPublisher:
         Returns:
             Number of documents deleted
         """
-        if not self.DOCUMENTS_DB.exists():
-            return 0
-
-        try:
-            with open(self.DOCUMENTS_DB, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"   ⚠️ Failed to load document records: {e}")
-            return 0
-
-        cutoff_date = datetime.now() - timedelta(days=self.RETENTION_DAYS)
-        deleted_count = 0
-        remaining_docs = []
-
-        for doc in data.get("documents", []):
-            created_at = datetime.fromisoformat(doc["created_at"])
-
-            if created_at < cutoff_date:
-                # Delete old document
-                print(f"   🗑️ Cleaning up old document: {doc['title']}")
-                success = await self.delete_document(doc["token"])
-                if success:
-                    deleted_count += 1
+        async with self._docs_lock:
+            try:
+                await self._ensure_docs_loaded()
+            except Exception as e:
+                logger.warning("   ⚠️ Failed to load document records: %s", e)
+                return 0
+
+            # Fold in records still waiting for the debounced flush
+            self._docs.extend(self._pending_docs)
+            self._pending_docs.clear()
+            if not self._docs:
+                return 0
+
+            cutoff_date = datetime.now() - timedelta(days=self.RETENTION_DAYS)
+            expired = []
+            remaining_docs = []
+            for doc in self._docs:
+                if datetime.fromisoformat(doc["created_at"]) < cutoff_date:
+                    expired.append(doc)
                 else:
-                    # Keep in list if deletion failed
                     remaining_docs.append(doc)
-            else:
-                remaining_docs.append(doc)
 
-        # Update records
-        data["documents"] = remaining_docs
-        with open(self.DOCUMENTS_DB, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            # Deletions are independent; run them with bounded concurrency
+            sem = asyncio.Semaphore(self.CLEANUP_CONCURRENCY)
+
+            async def delete_old(doc: dict) -> bool:
+                async with sem:
+                    logger.debug("   🗑️ Cleaning up old document: %s", doc['title'])
+                    return await self.delete_document(doc["token"])
+
+            results = await asyncio.gather(*(delete_old(doc) for doc in expired))
+            deleted_count = sum(results)
+            # Keep in list if deletion failed
+            remaining_docs.extend(doc for doc, success in zip(expired, results) if not success)
+
+            # Update records with a single write
+            self._docs = remaining_docs
+            await self._write_docs()
 
         if deleted_count > 0:
-            print(f"   ✅ Cleaned up {deleted_count} old documents")
+            logger.info("   ✅ Cleaned up %s old documents", deleted_count)
 
         return deleted_count
 
-    async def _send_message(self, receive_id: str, msg_type: str, content: str):
-        """Send a message via Feishu IM API."""
-        token = await self._get_tenant_access_token()
+    async def _send_message(self, receive_id: str, msg_type: str, content):
+        """Send a message via Feishu IM API.
+
+        content may be a ready JSON string or a dict (e.g. a card), which is
+        serialized here once since Feishu expects the content as a string.
+        """
         url = f"{self.BASE_URL}/im/v1/messages?receive_id_type=chat_id"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json; charset=utf-8"
-        }
         payload = {
             "receive_id": receive_id,
             "msg_type": msg_type,
-            "content": content
+            "content": content if isinstance(content, str) else _json_dumps(content)
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                data = await response.json()
-                if data.get("code") != 0:
-                    print(f"Feishu Send Message Error: {data.get('msg')} (code {data.get('code')})")
-                else:
-                    print(f"✅ Feishu message sent to {receive_id}")
+        try:
+            await self._request("POST", url, json_body=payload, idempotent=False)
+        except FeishuAPIError as e:
+            logger.error("Feishu Send Message Error: %s", e)
+        else:
+            logger.info("✅ Feishu message sent to %s", receive_id)
+
+    def _build_card_content(self, title: str, highlights: str, categories: dict, category_names: dict, doc_url: str = None) -> Optional[dict]:
+        """Construct Feishu Interactive Card content as a dict.
 
-    def _build_card_content(self, title: str, highlights: str, categories: dict, category_names: dict, doc_url: str = None) -> str:
-        """Construct Feishu Interactive Card JSON content.
+        Returns None when there are neither highlights nor a document link,
+        since the card would only hold its footer.
 
         Args:
             title: Card title
@@ -629,12 +926,23 @@ class FeishuPublisher:
             category_names: Dict of category_id -> display name (unused in simplified card)
             doc_url: Optional URL to the full document for click-through
         """
+        # The card only depends on these; categories are unused in the simplified card
+        if not (highlights or doc_url):
+            return None
+
+        memo_key = (title, highlights, doc_url)
+        if self._card_memo and self._card_memo[0] == memo_key:
+            return self._card_memo[1]
+
         elements = []
 
         # Only show highlights - top 3 eye-catching items
         if highlights:
             # Clean HTML tags if present (simple regex)
-            clean_highlights = re.sub(r'<[^>]+>', '', highlights).strip()
+            if "<" in highlights:
+                clean_highlights = _HTML_RE.sub('', highlights).strip()
+            else:
+                clean_highlights = highlights.strip()
             elements.append({
                 "tag": "div",
                 "text": {
@@ -691,7 +999,8 @@ class FeishuPublisher:
             "elements": elements
         }
 
-        return json.dumps(card)
+        self._card_memo = (memo_key, card)
+        return card
 
     async def send_digest_card(self, chat_id: str, title: str, highlights: str, categories: dict, category_names: dict, doc_url: str = None):
         """Send the news digest as an interactive card.
@@ -705,10 +1014,14 @@ class FeishuPublisher:
             doc_url: Optional URL to the full document for click-through
         """
         if not self.is_configured():
-             print("Feishu publisher not configured.")
+             logger.info("Feishu publisher not configured.")
              return
 
-        print(f"Sending Feishu card to {chat_id}...")
         card_content = self._build_card_content(title, highlights, categories, category_names, doc_url)
+        if card_content is None:
+            logger.info("No highlights or document link, skipping Feishu card to %s", chat_id)
+            return
+
+        logger.info("Sending Feishu card to %s...", chat_id)
         await self._send_message(chat_id, "interactive", card_content)
 
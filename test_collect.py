@@ -3,13 +3,20 @@
 Test script - collect data and preview results without sending email.
 """
 
+import argparse
 import asyncio
+import copy
+import json
 import sys
+import time
+from collections import OrderedDict
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+import aiohttp
 import yaml
 from collectors import (
     collect_all_rss,
@@ -19,93 +26,187 @@ from collectors import (
 )
 from processors import process_items
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    _YamlLoader = yaml.SafeLoader
 
-def load_config():
-    config_path = Path(__file__).parent / "config" / "sources.yaml"
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+_BAR60 = "=" * 60
+_BAR40 = "-" * 40
 
+# path -> (mtime, size, parsed config); reparsed only when the file changes
+_CONFIG_CACHE: "OrderedDict[str, tuple[float, int, dict]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
 
-async def test_collectors():
-    print(f"\n{'='*60}")
-    print(f"🧪 AI Daily Digest - 采集测试")
-    print(f"   时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*60}\n")
 
-    config = load_config()
+def load_config(config_path: Path = Path(__file__).parent / "config" / "sources.yaml"):
+    key = str(config_path)
+    stat = config_path.stat()
+    cached = _CONFIG_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        _CONFIG_CACHE.move_to_end(key)
+        # Callers may mutate the config, so never hand out the cached dict
+        return copy.deepcopy(cached[2])
 
-    # Test RSS
-    print("📡 测试 RSS 采集...")
-    try:
-        rss_items = await collect_all_rss(config.get("rss_sources", {}))
-        print(f"   ✅ RSS: 收集到 {len(rss_items)} 条\n")
-    except Exception as e:
-        print(f"   ❌ RSS 错误: {e}\n")
-        rss_items = []
+    # Hand libyaml the raw bytes; it decodes UTF-8 itself
+    with open(config_path, "rb") as f:
+        config = yaml.load(f.read(), Loader=_YamlLoader)
 
-    # Test arXiv
-    print("📄 测试 arXiv 采集...")
-    try:
-        arxiv_items = await collect_arxiv(config.get("arxiv", {}))
-        print(f"   ✅ arXiv: 收集到 {len(arxiv_items)} 篇论文\n")
-    except Exception as e:
-        print(f"   ❌ arXiv 错误: {e}\n")
-        arxiv_items = []
+    _CONFIG_CACHE[key] = (stat.st_mtime, stat.st_size, config)
+    _CONFIG_CACHE.move_to_end(key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+
+def _fmt_item(item, date_fmt: str = "%m-%d %H:%M") -> str:
+    """Format one preview entry (title, source/date, optional summary) as a single string."""
+    pub = item.published.strftime(date_fmt) if item.published else "N/A"
+    summary = f"  摘要: {item.summary[:80]}...\n" if item.summary else ""
+    return f"• {item.title[:60]}...\n  来源: {item.source} | {pub}\n{summary}"
 
-    # Test Hacker News
-    print("🔶 测试 Hacker News 采集...")
-    try:
-        hn_items = await collect_hackernews(config.get("hackernews", {}))
-        print(f"   ✅ HN: 收集到 {len(hn_items)} 条讨论\n")
-    except Exception as e:
-        print(f"   ❌ HN 错误: {e}\n")
-        hn_items = []
 
-    # Test Twitter (via Nitter - may fail due to instances being down)
-    print("🐦 测试 X/Twitter 采集 (via Nitter)...")
+async def _run_phase(name: str, coro):
+    """Await one collector phase, returning (name, items or the exception it raised)."""
     try:
-        twitter_items = await collect_twitter(config.get("twitter", {}))
-        print(f"   ✅ Twitter: 收集到 {len(twitter_items)} 条\n")
+        return name, await coro
     except Exception as e:
-        print(f"   ⚠️  Twitter 错误 (Nitter实例可能不可用): {e}\n")
-        twitter_items = []
+        return name, e
+
+
+async def test_collectors(verbose: bool = True, json_summary: bool = False):
+    """Collect from every source and preview the result.
+
+    Args:
+        verbose: Print progress and the preview; False skips all formatting
+        json_summary: Print the counts as one JSON object at the end
+    """
+    started = time.perf_counter()
+    # Read and parse the config in a worker thread while the banner prints
+    config_task = asyncio.create_task(asyncio.to_thread(load_config))
+
+    if verbose:
+        print("\n" + _BAR60)
+        print("🧪 AI Daily Digest - 采集测试")
+        print(f"   时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(_BAR60 + "\n")
+
+    config = await config_task
+
+    # One pooled session for every collector, so requests to the same host
+    # reuse keep-alive connections instead of a fresh TCP+TLS handshake each
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=30)
+    # One request budget shared by every collector, so a phase with many
+    # feeds can't starve the others
+    semaphore = asyncio.Semaphore(50)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # All four phases are independent network I/O, so run them together
+        # and report each one as soon as it finishes
+        if verbose:
+            print("📡 测试 RSS 采集...")
+            print("📄 测试 arXiv 采集...")
+            print("🔶 测试 Hacker News 采集...")
+            # Twitter goes via Nitter and may fail due to instances being down
+            print("🐦 测试 X/Twitter 采集 (via Nitter)...\n")
+        phases = [
+            ("rss", collect_all_rss(config.get("rss_sources", {}), session=session, semaphore=semaphore),
+             "   ✅ RSS: 收集到 {} 条\n", "   ❌ RSS 错误: {}\n"),
+            ("arxiv", collect_arxiv(config.get("arxiv", {}), session=session, semaphore=semaphore),
+             "   ✅ arXiv: 收集到 {} 篇论文\n", "   ❌ arXiv 错误: {}\n"),
+            ("hackernews", collect_hackernews(config.get("hackernews", {}), session=session, semaphore=semaphore),
+             "   ✅ HN: 收集到 {} 条讨论\n", "   ❌ HN 错误: {}\n"),
+            ("twitter", collect_twitter(config.get("twitter", {}), session=session, semaphore=semaphore),
+             "   ✅ Twitter: 收集到 {} 条\n", "   ⚠️  Twitter 错误 (Nitter实例可能不可用): {}\n"),
+        ]
+        results: dict[str, list | Exception] = {}
+        messages = {name: (ok_msg, err_msg) for name, _, ok_msg, err_msg in phases}
+        for next_done in asyncio.as_completed([_run_phase(name, coro) for name, coro, _, _ in phases]):
+            name, result = await next_done
+            results[name] = result
+            if verbose:
+                ok_msg, err_msg = messages[name]
+                if isinstance(result, Exception):
+                    print(err_msg.format(result))
+                else:
+                    print(ok_msg.format(len(result)))
+
+        # Back in phase order: deduplication keeps the first of two matching
+        # items, so processing must not depend on which source finished first
+        phase_items = []
+        collected = {}
+        for name in messages:
+            result = results[name]
+            if isinstance(result, Exception):
+                phase_items.append([])
+                collected[name] = f"error: {result}"
+            else:
+                phase_items.append(result)
+                collected[name] = len(result)
+        rss_items, arxiv_items, hn_items, twitter_items = phase_items
 
     # Combine and process
-    all_items = rss_items + arxiv_items + hn_items + twitter_items
-    print(f"{'='*60}")
-    print(f"📊 总计收集: {len(all_items)} 条")
+    # process_items only iterates, so chain the phases instead of concatenating
+    total = len(rss_items) + len(arxiv_items) + len(hn_items) + len(twitter_items)
+    if verbose:
+        print(_BAR60)
+        print(f"📊 总计收集: {total} 条")
 
     # Process
     output_config = config.get("output", {})
     max_per_category = output_config.get("max_per_category", 5)
-    categories = process_items(all_items, max_per_category=max_per_category)
-
-    print(f"\n📋 分类统计:")
-    category_names = output_config.get("category_names", {})
-    for cat, items in categories.items():
-        name = category_names.get(cat, cat)
-        print(f"   {name}: {len(items)} 条")
-
-    # Preview some items
-    print(f"\n{'='*60}")
-    print("📰 内容预览 (每类前2条):\n")
-
-    for cat, items in categories.items():
-        name = category_names.get(cat, cat)
-        print(f"\n{name}")
-        print("-" * 40)
-        for item in items[:2]:
-            print(f"• {item.title[:60]}...")
-            print(f"  来源: {item.source} | {item.published.strftime('%m-%d %H:%M') if item.published else 'N/A'}")
-            if item.summary:
-                print(f"  摘要: {item.summary[:80]}...")
-            print()
-
-    print(f"{'='*60}")
-    print("✅ 测试完成！数据采集正常工作。")
-    print("   运行 'python main.py' 发送完整邮件 (需配置SMTP)")
-    print(f"{'='*60}\n")
+    categories = process_items(
+        chain(rss_items, arxiv_items, hn_items, twitter_items),
+        max_per_category=max_per_category,
+    )
+    # Collection and processing only, before any preview output
+    elapsed = time.perf_counter() - started
+
+    if verbose:
+        # Build the stats and preview text first and write it once,
+        # instead of one console write per print() call
+        category_names_get = output_config.get("category_names", {}).get
+        buf = ["\n📋 分类统计:"]
+        for cat, items in categories.items():
+            name = category_names_get(cat, cat)
+            buf.append(f"   {name}: {len(items)} 条")
+
+        # Preview some items
+        buf.append("\n" + _BAR60)
+        buf.append("📰 内容预览 (每类前2条):\n")
+
+        for cat, items in categories.items():
+            name = category_names_get(cat, cat)
+            buf.append(f"\n{name}")
+            buf.append(_BAR40)
+            for item in items[:2]:
+                buf.append(_fmt_item(item))
+
+        sys.stdout.write("\n".join(buf) + "\n")
+
+        print(_BAR60)
+        print("✅ 测试完成！数据采集正常工作。")
+        print("   运行 'python main.py' 发送完整邮件 (需配置SMTP)")
+        print(_BAR60 + "\n")
+
+    if json_summary:
+        summary = {
+            "total": total,
+            "collected": collected,
+            "categories": {cat: len(items) for cat, items in categories.items()},
+            "elapsed_s": round(elapsed, 3),
+        }
+        print(json.dumps(summary, ensure_ascii=False))
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Collect from all sources and preview the results.")
+    parser.add_argument("--quiet", action="store_true",
+                        help="skip progress and preview output; print only the JSON summary")
+    parser.add_argument("--json", action="store_true",
+                        help="print a JSON summary of the counts at the end")
+    args = parser.parse_args(argv)
+    asyncio.run(test_collectors(verbose=not args.quiet, json_summary=args.json or args.quiet))
 
 
 if __name__ == "__main__":
-    asyncio.run(test_collectors())
+    main()
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 import sys
 import json
@@ -84,6 +85,9 @@ async def test_card_push():
         print("✅ Test finished (Check logs above for success/fail message)")
     except Exception as e:
         print(f"❌ Exception during send_digest_card: {e}")
+    finally:
+        await publisher.aclose()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(test_card_push())
@@ -1,5 +1,6 @@
 """Test full flow: Create document then send card with real link."""
 import asyncio
+import logging
 import os
 import sys
 from dotenv import load_dotenv
@@ -59,6 +60,7 @@ async def test_full_flow():
 
     if not doc_url:
         print("❌ Failed to create document")
+        await publisher.aclose()
         return
 
     print(f"   Document URL: {doc_url}")
@@ -102,9 +104,11 @@ async def test_full_flow():
     }
 
     await publisher.send_digest_card(chat_id, title, highlights, categories, category_names, doc_url)
+    await publisher.aclose()
 
     print("\n✅ Full flow test complete!")
     print(f"   Check your Feishu group - click the button to open: {doc_url}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(test_full_flow())